@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Optional
 
-from pony.orm import commit, db_session
+from pony.orm import commit, db_session, select
 
 from namer.models import File
 from namer.videophash import PerceptualHash
@@ -297,7 +297,8 @@ re_cleanup = [r'[0-9]{3,4}x[0-9]{3,4}', r'[0-9]{2}fps', r'[0-9]{3,4}p', r'[0-9]k
 
 
 def safe_write_file_to_database(working_item: Path, phash: PerceptualHash):
-    if not search_file_in_database(working_item):
+    search_result = search_file_in_database(working_item)
+    if not search_result or not search_result.phash:
         write_file_to_database(working_item, phash)
 
 
@@ -307,7 +308,23 @@ def write_file_to_database(working_item: Path, phash: PerceptualHash):
     item_phash = str(phash.phash) if phash else None
     item_oshash = phash.oshash if phash else None
 
-    File(file_name=working_item.name, file_size=item_stats.st_size, file_time=item_stats.st_mtime, duration=phash.duration, phash=item_phash, oshash=item_oshash)
+    search_result = File.get(file_name=working_item.name, file_size=item_stats.st_size, file_time=item_stats.st_mtime)
+    if search_result:
+        search_result.set(duration=phash.duration, phash=item_phash, oshash=item_oshash)
+    else:
+        File(file_name=working_item.name, file_size=item_stats.st_size, file_time=item_stats.st_mtime, duration=phash.duration, phash=item_phash, oshash=item_oshash)
+    commit()
+
+
+@db_session
+def store_file_duration_in_database(working_item: Path, duration: int):
+    item_stats = working_item.stat()
+
+    search_result = File.get(file_name=working_item.name, file_size=item_stats.st_size, file_time=item_stats.st_mtime)
+    if search_result:
+        search_result.duration = duration
+    else:
+        File(file_name=working_item.name, file_size=item_stats.st_size, file_time=item_stats.st_mtime, duration=duration)
     commit()
 
 
@@ -317,3 +334,12 @@ def search_file_in_database(working_item: Path) -> Optional[File]:
 
     search_result = File.get(file_name=working_item.name, file_size=item_stats.st_size, file_time=item_stats.st_mtime)
     return search_result
+
+
+@db_session
+def search_file_duration_in_database(working_item: Path) -> Optional[int]:
+    item_stats = working_item.stat()
+    file_name, file_size, file_time = working_item.name, item_stats.st_size, item_stats.st_mtime
+
+    search_result = select(f.duration for f in File if f.file_name == file_name and f.file_size == file_size and f.file_time == file_time).first()
+    return search_result
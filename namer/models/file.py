@@ -1,4 +1,4 @@
-from pony.orm import Optional, PrimaryKey, Required
+from pony.orm import Optional, PrimaryKey, Required, composite_index
 
 from namer.models import db
 
@@ -13,3 +13,5 @@ class File(db.Entity):
     duration = Optional(int)
     phash = Optional(str)
     oshash = Optional(str)
+
+    composite_index(file_name, file_size)
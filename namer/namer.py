@@ -333,7 +333,7 @@ def check_arguments(file_to_process: Path, dir_to_process: Path, config_override
 def calculate_phash(file: Path, config: NamerConfig) -> Optional[PerceptualHash]:
     if config.use_database:
         search_result = search_file_in_database(file)
-        if search_result:
+        if search_result and search_result.phash:
             logger.info(f'Getting phash from db for file "{file}"')
             return return_perceptual_hash(search_result.duration, search_result.phash, search_result.oshash)
 
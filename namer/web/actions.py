@@ -4,21 +4,25 @@ Helper functions to tie in to namer's functionality.
 
 import gzip
 import math
+import os
 import shutil
+import struct
+import time
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
 from queue import Queue
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 import orjson
 import jsonpickle
+from loguru import logger
 from werkzeug.routing import Rule
 
 from namer.comparison_results import ComparisonResults, SceneType
 from namer.configuration import NamerConfig
 from namer.command import gather_target_files_from_dir, is_interesting_movie, is_relative_to, Command
-from namer.database import search_file_in_database
+from namer.database import search_file_duration_in_database, store_file_duration_in_database
 from namer.ffmpeg import FFMpeg
 from namer.fileinfo import FileInfo, parse_file_name
 from namer.metadataapi import __build_url, __evaluate_match, __request_response_json_object, __metadataapi_response_to_data
@@ -100,53 +104,266 @@ def command_to_file_info(command: Command, config: NamerConfig) -> Dict:
     return res
 
 
+# Files recently found missing from failed_dir, to avoid re-checking them on every web UI refresh
+_missing_files: Dict[str, float] = {}
+_MISSING_TTL = 5.0
+_MISSING_MAX_SIZE = 1024
+
+
 def __get_file_duration(file_name: str, config: NamerConfig) -> Optional[int]:
     """
     Get file duration from database cache or FFProbe.
     Returns duration in seconds, or None if unavailable.
     """
-    # Construct file path in failed_dir
-    file_path = Path(config.failed_dir) / file_name
+    if not getattr(config, 'failed_dir', None):
+        return None
+
+    # Construct file path in failed_dir, plain strings keep pathlib off this hot path
+    file_path = os.path.join(str(config.failed_dir), file_name)
 
-    # Check if file exists
-    if not file_path.exists():
+    missing_time = _missing_files.get(file_path)
+    if missing_time:
+        if time.monotonic() - missing_time < _MISSING_TTL:
+            return None
+
+        _missing_files.pop(file_path, None)
+
+    # A single stat both checks the file exists and gives the mtime for the cache key,
+    # file_name may be a raw search query so NUL bytes and over-long names count as missing too
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except (OSError, ValueError):
+        if len(_missing_files) >= _MISSING_MAX_SIZE:
+            _missing_files.pop(next(iter(_missing_files)), None)
+
+        _missing_files[file_path] = time.monotonic()
+        return None
+
+    try:
+        return _cached_duration(file_path, mtime_ns, config.use_database, config.ffmpeg)
+    except _DurationUnavailable:
         return None
 
+
+class _DurationUnavailable(Exception):
+    """
+    Raised instead of returning None, lru_cache doesn't memoize exceptions so failed lookups are retried.
+    """
+
+
+@lru_cache(maxsize=4096)
+def _cached_duration(path_str: str, mtime_ns: int, use_database: bool, ffmpeg: FFMpeg) -> int:
+    file_path = Path(path_str)
+
     # Try to get from database cache first
-    cached_file = search_file_in_database(file_path)
-    if cached_file and cached_file.duration:
-        return cached_file.duration
+    if use_database:
+        cached_duration = search_file_duration_in_database(file_path)
+        if cached_duration:
+            return cached_duration
+
+    # Read the duration from the container header, fallback to FFProbe for other formats
+    duration = _read_container_duration(file_path)
+    if duration is None:
+        try:
+            probe_result = ffmpeg.ffprobe(file_path)
+            if probe_result and probe_result.format and probe_result.format.duration:
+                duration = int(probe_result.format.duration)
+        except Exception:
+            # Silently fail if FFProbe unavailable
+            pass
+
+    if duration is None:
+        raise _DurationUnavailable(path_str)
+
+    # Write back so the next lookup is served from the database, a failed write shouldn't fail the search
+    if use_database:
+        try:
+            store_file_duration_in_database(file_path, duration)
+        except Exception as e:
+            logger.warning('Could not store duration for {}: {}', file_path, e)
+
+    return duration
+
+
+def _read_container_duration(file: Path) -> Optional[int]:
+    """
+    Read the duration in seconds straight from a mp4/mov or mkv/webm header, without spawning FFProbe.
+    Returns None for other formats or if the header can't be parsed.
+    """
+    suffix = file.suffix.lower()
+    if suffix in ('.mp4', '.m4v', '.mov'):
+        reader = _read_mp4_duration
+    elif suffix in ('.mkv', '.webm'):
+        reader = _read_mkv_duration
+    else:
+        return None
 
-    # Fallback to FFProbe if not cached
     try:
-        ffmpeg = FFMpeg(config.ffmpeg_path, config.ffprobe_path)
-        probe_result = ffmpeg.ffprobe(file_path)
-        if probe_result and probe_result.format and probe_result.format.duration:
-            return int(probe_result.format.duration)
-    except Exception:
-        # Silently fail if FFProbe unavailable
-        pass
+        with file.open('rb') as f:
+            return reader(f, f.seek(0, 2))
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _iter_mp4_boxes(f: BinaryIO, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """
+    Yield (type, body start, box end) for the mp4 boxes between start and end.
+    """
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, box_type = struct.unpack('>I4s', f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+
+        if size < header:
+            return
+
+        yield box_type, pos + header, pos + size
+        pos += size
+
+
+def _read_mp4_duration(f: BinaryIO, size: int) -> Optional[int]:
+    for box_type, body, box_end in _iter_mp4_boxes(f, 0, size):
+        if box_type != b'moov':
+            continue
+
+        for child_type, child_body, _ in _iter_mp4_boxes(f, body, box_end):
+            if child_type != b'mvhd':
+                continue
+
+            f.seek(child_body)
+            header = f.read(4)
+            if len(header) != 4:
+                return None
+
+            version = header[0]
+            if version == 1:
+                _, _, timescale, duration = struct.unpack('>QQIQ', f.read(28))
+            else:
+                _, _, timescale, duration = struct.unpack('>IIII', f.read(16))
+
+            # Fragmented files leave the duration empty
+            if not timescale or not duration or duration in (0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):
+                return None
+
+            return int(duration / timescale)
 
     return None
 
 
+def _read_ebml_vint(f: BinaryIO, keep_marker: bool) -> Tuple[int, int]:
+    """
+    Read an EBML variable size integer, returns (value, length in bytes).
+    """
+    data = f.read(1)
+    if not data:
+        raise ValueError('unexpected end of file')
+
+    value, length, mask = data[0], 1, 0x80
+    while length <= 8 and not value & mask:
+        length += 1
+        mask >>= 1
+
+    if length > 8:
+        raise ValueError('invalid EBML integer')
+
+    if not keep_marker:
+        value &= mask - 1
+
+    rest = f.read(length - 1)
+    if len(rest) != length - 1:
+        raise ValueError('unexpected end of file')
+
+    for byte in rest:
+        value = (value << 8) | byte
+
+    return value, length
+
+
+def _iter_ebml_elements(f: BinaryIO, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield (id, body start, element end) for the EBML elements between start and end.
+    """
+    pos = start
+    while pos < end:
+        f.seek(pos)
+        element_id, id_length = _read_ebml_vint(f, True)
+        size, size_length = _read_ebml_vint(f, False)
+        body = pos + id_length + size_length
+        if size == (1 << (7 * size_length)) - 1:
+            # Unknown size, the element runs to the end of its parent
+            size = end - body
+
+        yield element_id, body, body + size
+        pos = body + size
+
+
+def _read_mkv_duration(f: BinaryIO, size: int) -> Optional[int]:
+    for element_id, body, element_end in _iter_ebml_elements(f, 0, size):
+        if element_id != 0x18538067:  # Segment
+            continue
+
+        for child_id, child_body, child_end in _iter_ebml_elements(f, body, element_end):
+            if child_id == 0x1F43B675:  # Cluster, Info is always written before media data
+                return None
+            elif child_id != 0x1549A966:  # Info
+                continue
+
+            timestamp_scale, duration = 1_000_000, None
+            for info_id, info_body, info_end in _iter_ebml_elements(f, child_body, child_end):
+                # Both values fit in 8 bytes, anything larger is a corrupt size field
+                length = info_end - info_body
+                if info_id not in (0x2AD7B1, 0x4489) or length > 8:
+                    continue
+
+                f.seek(info_body)
+                data = f.read(length)
+                if len(data) != length:
+                    return None
+
+                if info_id == 0x2AD7B1:  # TimestampScale
+                    timestamp_scale = int.from_bytes(data, 'big')
+                elif length in (4, 8):  # Duration
+                    duration = struct.unpack('>f' if length == 4 else '>d', data)[0]
+
+            if not duration:
+                return None
+
+            seconds = duration * timestamp_scale / 1_000_000_000
+            return int(seconds) if math.isfinite(seconds) and seconds > 0 else None
+
+        return None
+
+    return None
+
+
+def _decode_response(body: str) -> Dict:
+    return orjson.loads(body)
+
+
 def metadataapi_responses_to_webui_response(responses: Dict, config: NamerConfig, file: str, phash: Optional[PerceptualHash] = None) -> List:
     file = Path(file)
     file_name = file.stem
     if not file.suffix and config.target_extensions:
         file_name += '.' + config.target_extensions[0]
 
+    name_parts = parse_file_name(file_name, config)
+
+    # Get file duration once (cache lookup or FFProbe), every scene from every response shares it
+    file_duration = __get_file_duration(file_name, config)
+
     file_infos = []
     for url, response in responses.items():
         if response and response.strip() != '':
-            json_obj = orjson.loads(response)
-            formatted = orjson.dumps(orjson.loads(response), option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode('UTF-8')
-            name_parts = parse_file_name(file_name, config)
+            json_obj = _decode_response(response)
+            formatted = orjson.dumps(json_obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode('UTF-8')
             file_infos.extend(__metadataapi_response_to_data(json_obj, url, formatted, name_parts, config))
 
-    # Get file duration once (cache lookup or FFProbe)
-    file_duration = __get_file_duration(file_name, config)
-
     files = []
     for scene_data in file_infos:
         scene = __evaluate_match(scene_data.original_parsed_filename, scene_data, config, phash).as_dict()
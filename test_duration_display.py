@@ -7,87 +7,320 @@ Tests that:
 3. Both durations are properly formatted
 """
 
+import os
+import struct
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import Mock, patch
-from namer.web.actions import __get_file_duration, metadataapi_responses_to_webui_response
+from unittest.mock import DEFAULT, Mock, patch
+
+import pytest
+from pony import orm
+
+from namer.web.actions import __get_file_duration, _MISSING_TTL, _cached_duration, _missing_files, _read_container_duration, metadataapi_responses_to_webui_response
 from namer.configuration import NamerConfig
+from namer.database import search_file_duration_in_database, store_file_duration_in_database
 from namer.comparison_results import LookedUpFileInfo, SceneType
 
 
-def test_get_file_duration_from_cache():
-    """Test retrieving duration from database cache."""
+def _make_base_config():
     config = Mock(spec=NamerConfig)
     config.failed_dir = Path("/tmp/failed")
+    config.target_extensions = ["mp4"]
+    config.use_database = True
+    return config
 
-    # Mock cached file with duration
-    mock_cached_file = Mock()
-    mock_cached_file.duration = 3661  # 1 hour, 1 minute, 1 second
 
-    mock_file_path = Mock(spec=Path)
-    mock_file_path.exists.return_value = True
+@pytest.fixture
+def config():
+    return _make_base_config()
 
-    with patch('namer.web.actions.Path', return_value=mock_file_path) as mock_path_class:
-        mock_path_class.return_value.__truediv__ = Mock(return_value=mock_file_path)
 
-        with patch('namer.web.actions.search_file_in_database', return_value=mock_cached_file):
-            duration = __get_file_duration("test_video.mp4", config)
+_DURATION_SCENARIOS = [('cache', 3661), ('ffprobe', 1234), ('missing', None)]
 
-    assert duration == 3661, f"Expected 3661, got {duration}"
-    print("✓ Cache retrieval test passed: duration = 3661 seconds")
 
+@pytest.mark.parametrize('scenario,expected', _DURATION_SCENARIOS)
+def test_get_file_duration(config, tmp_path, scenario, expected):
+    """Test duration lookup from the database cache, the FFProbe fallback and for missing files."""
+    config.failed_dir = tmp_path
+    video = tmp_path / "test_video.mp4"
+    if scenario != 'missing':
+        video.write_bytes(b"")
 
-def test_get_file_duration_not_cached():
-    """Test FFProbe fallback when file not in cache."""
-    config = Mock(spec=NamerConfig)
-    config.failed_dir = "/tmp/failed"
-    config.ffmpeg_path = "ffmpeg"
-    config.ffprobe_path = "ffprobe"
+    cached_duration = 3661  # 1 hour, 1 minute, 1 second
 
     # Mock FFProbe result
     mock_probe_result = Mock()
-    mock_probe_result.format = Mock()
     mock_probe_result.format.duration = 1234.5  # float
+    config.ffmpeg = Mock()
+    config.ffmpeg.ffprobe.return_value = mock_probe_result
 
-    with patch('namer.web.actions.Path') as mock_path:
-        mock_path_instance = Mock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+    _cached_duration.cache_clear()
+    _missing_files.clear()
+    with patch('namer.web.actions.search_file_duration_in_database', return_value=cached_duration if scenario == 'cache' else None) as mock_search, \
+            patch('namer.web.actions.store_file_duration_in_database'), \
+            patch('namer.web.actions.os', wraps=os) as mock_os:
 
-        with patch('namer.web.actions.search_file_in_database', return_value=None):
-            with patch('namer.web.actions.FFMpeg') as mock_ffmpeg:
-                mock_ffmpeg_instance = Mock()
-                mock_ffmpeg_instance.ffprobe.return_value = mock_probe_result
-                mock_ffmpeg.return_value = mock_ffmpeg_instance
+        duration = __get_file_duration(video.name, config)
+        second_duration = __get_file_duration(video.name, config)
 
-                duration = __get_file_duration("test_video.mp4", config)
+    assert duration == expected, f"Expected {expected}, got {duration}"
+    assert second_duration == expected, f"Expected {expected}, got {second_duration}"
 
-    assert duration == 1234, f"Expected 1234 (int), got {duration}"
-    print("✓ FFProbe fallback test passed: duration = 1234 seconds (converted from 1234.5)")
+    # The expensive part of each scenario runs once, the repeated lookup is served from memory
+    if scenario != 'missing':
+        assert mock_os.stat.call_count == 2, f"Expected 1 stat() call per lookup, got {mock_os.stat.call_count}"
 
+    if scenario == 'cache':
+        assert mock_search.call_count == 1, f"Expected 1 database lookup, got {mock_search.call_count}"
+        config.ffmpeg.ffprobe.assert_not_called()
+    elif scenario == 'ffprobe':
+        assert config.ffmpeg.ffprobe.call_count == 1, f"Expected 1 FFProbe run, got {config.ffmpeg.ffprobe.call_count}"
+    else:
+        mock_search.assert_not_called()
+        assert mock_os.stat.call_count == 1, f"Expected 1 stat() call, got {mock_os.stat.call_count}"
+
+    print(f"✓ {scenario} lookup test passed: duration = {duration}")
+
+
+def test_ffprobe_result_written_back(config, tmp_path):
+    """Test FFProbe durations are stored so later lookups skip FFProbe."""
+    config.failed_dir = tmp_path
+    config.use_database = True
+    (tmp_path / "test_video.mp4").write_bytes(b"")
+
+    mock_probe_result = Mock()
+    mock_probe_result.format = Mock()
+    mock_probe_result.format.duration = 1234.5
+    config.ffmpeg = Mock()
+    config.ffmpeg.ffprobe.return_value = mock_probe_result
+
+    stored = {}
+
+    def search(file_path):
+        return stored.get(file_path)
+
+    def store(file_path, duration):
+        stored[file_path] = duration
+
+    with patch('namer.web.actions.search_file_duration_in_database', side_effect=search):
+        with patch('namer.web.actions.store_file_duration_in_database', side_effect=store) as mock_store:
+            _cached_duration.cache_clear()
+            _missing_files.clear()
+            duration = __get_file_duration("test_video.mp4", config)
+
+            # Drop the in-process memo so the second call has to go to the database
+            _cached_duration.cache_clear()
+            second_duration = __get_file_duration("test_video.mp4", config)
+
+    assert duration == 1234, f"Expected 1234, got {duration}"
+    assert second_duration == 1234, f"Expected 1234, got {second_duration}"
+    assert mock_store.call_count == 1, f"Expected 1 database write, got {mock_store.call_count}"
+    assert config.ffmpeg.ffprobe.call_count == 1, f"Expected 1 FFProbe run, got {config.ffmpeg.ffprobe.call_count}"
+    print("✓ FFProbe write-back test passed: second lookup served from database")
 
-def test_get_file_duration_file_not_exists():
-    """Test graceful handling when file doesn't exist."""
-    config = Mock(spec=NamerConfig)
-    config.failed_dir = "/tmp/failed"
 
-    with patch('namer.web.actions.Path') as mock_path:
-        mock_path_instance = Mock()
-        mock_path_instance.exists.return_value = False
-        mock_path.return_value = mock_path_instance
+def test_failed_write_back_still_returns_duration(config, tmp_path):
+    """Test a database error while storing the duration doesn't fail the lookup."""
+    config.failed_dir = tmp_path
+    config.use_database = True
+    (tmp_path / "test_video.mp4").write_bytes(b"")
 
-        duration = __get_file_duration("nonexistent.mp4", config)
+    mock_probe_result = Mock()
+    mock_probe_result.format.duration = 1234.5
+    config.ffmpeg = Mock()
+    config.ffmpeg.ffprobe.return_value = mock_probe_result
+
+    _cached_duration.cache_clear()
+    _missing_files.clear()
+    with patch('namer.web.actions.search_file_duration_in_database', return_value=None), \
+            patch('namer.web.actions.store_file_duration_in_database', side_effect=orm.OperationalError('database is locked')) as mock_store:
+        duration = __get_file_duration("test_video.mp4", config)
+
+    assert duration == 1234, f"Expected 1234, got {duration}"
+    assert mock_store.call_count == 1, f"Expected 1 database write, got {mock_store.call_count}"
+    print("✓ Failed write-back test passed: duration is still returned")
+
+
+def test_failed_ffprobe_not_memoized(config, tmp_path):
+    """Test a lookup that found no duration is retried instead of being served from memory."""
+    config.failed_dir = tmp_path
+    config.use_database = False
+    (tmp_path / "test_video.mp4").write_bytes(b"")
+
+    mock_probe_result = Mock()
+    mock_probe_result.format.duration = 1234.5
+    config.ffmpeg = Mock()
+    config.ffmpeg.ffprobe.side_effect = [None, mock_probe_result]
+
+    _cached_duration.cache_clear()
+    _missing_files.clear()
+    duration = __get_file_duration("test_video.mp4", config)
+    second_duration = __get_file_duration("test_video.mp4", config)
 
     assert duration is None, f"Expected None, got {duration}"
-    print("✓ File not exists test passed: duration = None")
+    assert second_duration == 1234, f"Expected 1234, got {second_duration}"
+    assert config.ffmpeg.ffprobe.call_count == 2, f"Expected 2 FFProbe runs, got {config.ffmpeg.ffprobe.call_count}"
+    print("✓ Failed FFProbe test passed: the lookup is retried")
 
 
-def test_metadataapi_response_includes_durations():
-    """Test that both TPDB and file durations are included in response."""
-    config = Mock(spec=NamerConfig)
-    config.failed_dir = "/tmp/failed"
-    config.target_extensions = ["mp4"]
+@contextmanager
+def _file_database():
+    """
+    A private in-memory database with its own File entity, so the global namer.models.db is never bound.
+    """
+    database = orm.Database()
+
+    class File(database.Entity):
+        id = orm.PrimaryKey(int, auto=True)
+
+        file_name = orm.Required(str)
+        file_size = orm.Required(int, size=64)
+        file_time = orm.Required(float)
+
+        duration = orm.Optional(int)
+        phash = orm.Optional(str)
+        oshash = orm.Optional(str)
+
+        orm.composite_index(file_name, file_size)
+
+    database.bind(provider='sqlite', filename=':memory:')
+    database.generate_mapping(create_tables=True)
+    try:
+        with patch('namer.database.File', File):
+            yield database
+    finally:
+        database.disconnect()
+
+
+@pytest.fixture
+def file_database():
+    with _file_database() as database:
+        yield database
+
 
-    # Mock scene data with TPDB duration
+def test_search_file_duration_in_database_reads_only_duration(file_database, tmp_path):
+    """Test the duration lookup selects just the duration column."""
+    video = tmp_path / "test_video.mp4"
+    video.write_bytes(b"")
+    store_file_duration_in_database(video, 1820)
+
+    duration = search_file_duration_in_database(video)
+    sql = file_database.last_sql
+
+    assert duration == 1820, f"Expected 1820, got {duration}"
+    assert '"duration"' in sql, f"Expected duration column in query, got {sql}"
+    assert '"phash"' not in sql and '"oshash"' not in sql, f"Expected no hash columns in query, got {sql}"
+    print("✓ Database duration lookup test passed: only the duration column is read")
+
+
+def test_get_file_duration_from_container_header(config, tmp_path):
+    """Test mp4 durations are read from the mvhd box without FFProbe."""
+    config.failed_dir = tmp_path
+    config.use_database = False
+
+    # Minimal mp4: ftyp + moov/mvhd with a 1000 timescale and 90.5 seconds duration
+    ftyp = struct.pack('>I4s4sI4s', 20, b'ftyp', b'isom', 0, b'isom')
+    mvhd_body = struct.pack('>B3sIIII', 0, b'\0\0\0', 0, 0, 1000, 90500) + bytes(80)
+    mvhd = struct.pack('>I4s', 8 + len(mvhd_body), b'mvhd') + mvhd_body
+    moov = struct.pack('>I4s', 8 + len(mvhd), b'moov') + mvhd
+    (tmp_path / "header_only.mp4").write_bytes(ftyp + moov)
+
+    config.ffmpeg = Mock()
+
+    _cached_duration.cache_clear()
+    duration = __get_file_duration("header_only.mp4", config)
+
+    assert duration == 90, f"Expected 90, got {duration}"
+    config.ffmpeg.ffprobe.assert_not_called()
+
+    # Truncated mp4: the mvhd box header is the last 8 bytes of the file
+    truncated_moov = struct.pack('>I4s', 16, b'moov') + struct.pack('>I4s', 108, b'mvhd')
+    (tmp_path / "truncated.mp4").write_bytes(ftyp + truncated_moov)
+    assert _read_container_duration(tmp_path / "truncated.mp4") is None, "Expected None for a truncated mp4"
+
+    # mkv with an infinite Info/Duration
+    ebml = bytes.fromhex('1A45DFA3') + b'\x80'
+    info = bytes.fromhex('1549A966') + b'\x8B' + bytes.fromhex('4489') + b'\x88' + struct.pack('>d', float('inf'))
+    segment = bytes.fromhex('18538067') + bytes([0x80 | len(info)]) + info
+    (tmp_path / "infinite.mkv").write_bytes(ebml + segment)
+    assert _read_container_duration(tmp_path / "infinite.mkv") is None, "Expected None for an infinite mkv duration"
+
+    # mkv whose Info/Duration size field claims 2^50 bytes
+    info = bytes.fromhex('1549A966') + b'\x8A' + bytes.fromhex('4489') + bytes.fromhex('0104000000000000')
+    segment = bytes.fromhex('18538067') + bytes([0x80 | len(info)]) + info
+    (tmp_path / "oversized.mkv").write_bytes(ebml + segment)
+    assert _read_container_duration(tmp_path / "oversized.mkv") is None, "Expected None for an oversized mkv duration"
+    print("✓ Container header test passed: duration = 90 seconds without FFProbe")
+
+
+def test_get_file_duration_no_failed_dir(config):
+    """Test nothing is looked up when failed_dir isn't configured."""
+    config.failed_dir = None
+
+    with patch('namer.web.actions.search_file_duration_in_database') as mock_search:
+        duration = __get_file_duration("test_video.mp4", config)
+
+    assert duration is None, f"Expected None, got {duration}"
+    mock_search.assert_not_called()
+    print("✓ No failed_dir test passed: duration = None")
+
+
+def test_get_file_duration_invalid_file_name(config, tmp_path):
+    """Test search queries that can't be file names are treated as missing files."""
+    config.failed_dir = tmp_path
+
+    _missing_files.clear()
+    with patch('namer.web.actions.search_file_duration_in_database') as mock_search:
+        assert __get_file_duration("test\x00video.mp4", config) is None, "Expected None for a name with a NUL byte"
+        assert __get_file_duration("a" * 1000 + ".mp4", config) is None, "Expected None for an over-long name"
+
+    mock_search.assert_not_called()
+    assert str(tmp_path / "test\x00video.mp4") in _missing_files, "Expected the NUL byte name to be recorded as missing"
+    print("✓ Invalid file name test passed: duration = None")
+
+
+def test_missing_files_cache_follows_failed_dir(config, tmp_path):
+    """Test a file missing from one failed_dir is still found in another, and expired misses are dropped."""
+    old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+    old_dir.mkdir()
+    new_dir.mkdir()
+    (new_dir / "test_video.mp4").write_bytes(b"")
+
+    _cached_duration.cache_clear()
+    _missing_files.clear()
+    with patch('namer.web.actions.search_file_duration_in_database', return_value=1820):
+        config.failed_dir = old_dir
+        assert __get_file_duration("test_video.mp4", config) is None, "Expected None for the old failed_dir"
+
+        config.failed_dir = new_dir
+        duration = __get_file_duration("test_video.mp4", config)
+
+        missing_path = str(old_dir / "test_video.mp4")
+        _missing_files[missing_path] -= _MISSING_TTL
+        config.failed_dir = old_dir
+        __get_file_duration("test_video.mp4", config)
+        expired_time = _missing_files[missing_path]
+
+    assert duration == 1820, f"Expected 1820, got {duration}"
+    assert time.monotonic() - expired_time < _MISSING_TTL, "Expected the expired miss to be replaced"
+    print("✓ Missing files cache test passed: entries are keyed by full path")
+
+
+# Everything metadataapi_responses_to_webui_response calls out to, patched with patch.multiple
+_WEBUI_PATCH_TARGETS = {
+    '__metadataapi_response_to_data': DEFAULT,
+    '__evaluate_match': DEFAULT,
+    'search_file_duration_in_database': DEFAULT,
+    'parse_file_name': DEFAULT,
+    '_decode_response': DEFAULT,
+}
+
+
+def _make_mock_scene():
+    """Scene data as returned by TPDB, with a 30 minute duration."""
     mock_scene = Mock(spec=LookedUpFileInfo)
     mock_scene.uuid = "test-uuid-123"
     mock_scene.type = SceneType.SCENE
@@ -99,69 +332,113 @@ def test_metadataapi_response_includes_durations():
     mock_scene.network = "TestNetwork"
     mock_scene.performers = []
     mock_scene.original_parsed_filename = {}
+    return mock_scene
 
-    # Mock file duration from cache
-    mock_cached_file = Mock()
-    mock_cached_file.duration = 1820  # 30 min 20 sec actual file
 
-    with patch('namer.web.actions.__metadataapi_response_to_data', return_value=[mock_scene]):
-        with patch('namer.web.actions.__evaluate_match') as mock_evaluate:
-            mock_comparison = Mock()
-            mock_comparison.as_dict.return_value = {'name_match': 98.5, 'phash_distance': None}
-            mock_evaluate.return_value = mock_comparison
+def test_metadataapi_response_includes_durations(config, tmp_path):
+    """Test that both TPDB and file durations are included in response."""
+    mock_scene = _make_mock_scene()
 
-            with patch('namer.web.actions.search_file_in_database', return_value=mock_cached_file):
-                with patch('namer.web.actions.Path') as mock_path:
-                    mock_path_instance = Mock()
-                    mock_path_instance.exists.return_value = True
-                    mock_path_instance.stem = "test_video"
-                    mock_path_instance.suffix = ".mp4"
-                    mock_path.return_value = mock_path_instance
+    # File duration from cache
+    cached_duration = 1820  # 30 min 20 sec actual file
 
-                    responses = {'http://api.example.com': '{"data": []}'}
+    mock_comparison = Mock()
+    mock_comparison.as_dict.return_value = {'name_match': 98.5, 'phash_distance': None}
 
-                    with patch('namer.web.actions.orjson.loads', return_value={}):
-                        with patch('namer.web.actions.orjson.dumps', return_value=b'{}'):
-                            with patch('namer.web.actions.parse_file_name', return_value={}):
-                                result = metadataapi_responses_to_webui_response(
-                                    responses, config, "test_video.mp4"
-                                )
+    # The query has no extension, so the file is looked up with the first target extension
+    config.failed_dir = tmp_path
+    (tmp_path / "test_video.mp4").write_bytes(b"")
 
-    assert len(result) == 1, f"Expected 1 result, got {len(result)}"
+    responses = {
+        'http://api.example.com/scenes': '{"data": []}',
+        'http://api.example.com/movies': '{"data": []}',
+    }
 
-    scene_result = result[0]
-    assert 'looked_up' in scene_result, "Missing 'looked_up' key"
-    assert 'file_duration' in scene_result, "Missing 'file_duration' key"
+    with patch.multiple('namer.web.actions', **_WEBUI_PATCH_TARGETS) as mocks:
+        mocks['_decode_response'].return_value = {}
+        mocks['__metadataapi_response_to_data'].return_value = [mock_scene, mock_scene]
+        mocks['__evaluate_match'].return_value = mock_comparison
+        mocks['search_file_duration_in_database'].return_value = cached_duration
+        mocks['parse_file_name'].return_value = {}
+
+        _cached_duration.cache_clear()
+        result = metadataapi_responses_to_webui_response(responses, config, "test_video")
+
+    mock_search = mocks['search_file_duration_in_database']
+
+    # Each response body is decoded once and the file name parsed once
+    assert mocks['_decode_response'].call_count == len(responses), \
+        f"Expected {len(responses)} decodes, got {mocks['_decode_response'].call_count}"
+    assert mocks['parse_file_name'].call_count == 1, \
+        f"Expected 1 file name parse, got {mocks['parse_file_name'].call_count}"
 
-    # Check TPDB duration
-    assert scene_result['looked_up']['duration'] == 1800, \
-        f"Expected TPDB duration 1800, got {scene_result['looked_up'].get('duration')}"
+    assert len(result) == 4, f"Expected 4 results, got {len(result)}"
 
-    # Check file duration
-    assert scene_result['file_duration'] == 1820, \
-        f"Expected file duration 1820, got {scene_result.get('file_duration')}"
+    # File duration is looked up once per call, not once per scene or response
+    assert mock_search.call_count == 1, \
+        f"Expected 1 database lookup, got {mock_search.call_count}"
 
+    for scene_result in result:
+        assert 'looked_up' in scene_result, "Missing 'looked_up' key"
+        assert 'file_duration' in scene_result, "Missing 'file_duration' key"
+
+        # Check TPDB duration
+        assert scene_result['looked_up']['duration'] == 1800, \
+            f"Expected TPDB duration 1800, got {scene_result['looked_up'].get('duration')}"
+
+        # Check file duration
+        assert scene_result['file_duration'] == 1820, \
+            f"Expected file duration 1820, got {scene_result.get('file_duration')}"
+
+    scene_result = result[0]
     print("✓ API response test passed:")
     print(f"  - TPDB duration: {scene_result['looked_up']['duration']} seconds (30:00)")
     print(f"  - File duration: {scene_result['file_duration']} seconds (30:20)")
+    print(f"  - Database lookups for {len(result)} scenes: {mock_search.call_count}")
 
 
 if __name__ == "__main__":
     print("Running duration display validation tests...\n")
 
     try:
-        test_get_file_duration_from_cache()
-        test_get_file_duration_not_cached()
-        test_get_file_duration_file_not_exists()
-        test_metadataapi_response_includes_durations()
-
-        print("\n✅ All tests passed! Hypothesis validated.")
-        print("\nValidation Summary:")
-        print("  1. ✓ Database cache retrieval works correctly")
-        print("  2. ✓ FFProbe fallback works correctly")
-        print("  3. ✓ Graceful handling of missing files")
-        print("  4. ✓ Both TPDB and file durations included in API response")
-        print("  5. ✓ Duration values are properly typed (int)")
+        for scenario, expected in _DURATION_SCENARIOS:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                test_get_file_duration(_make_base_config(), Path(tmp_dir), scenario, expected)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_ffprobe_result_written_back(_make_base_config(), Path(tmp_dir))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_failed_write_back_still_returns_duration(_make_base_config(), Path(tmp_dir))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_failed_ffprobe_not_memoized(_make_base_config(), Path(tmp_dir))
+        with _file_database() as database, tempfile.TemporaryDirectory() as tmp_dir:
+            test_search_file_duration_in_database_reads_only_duration(database, Path(tmp_dir))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_get_file_duration_from_container_header(_make_base_config(), Path(tmp_dir))
+        test_get_file_duration_no_failed_dir(_make_base_config())
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_get_file_duration_invalid_file_name(_make_base_config(), Path(tmp_dir))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_missing_files_cache_follows_failed_dir(_make_base_config(), Path(tmp_dir))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_metadataapi_response_includes_durations(_make_base_config(), Path(tmp_dir))
+
+        msgs = [
+            "\n✅ All tests passed! Hypothesis validated.",
+            "\nValidation Summary:",
+            "  1. ✓ Database cache retrieval works correctly",
+            "     ✓ Only the duration column is read from the database",
+            "  2. ✓ FFProbe fallback works correctly",
+            "     ✓ FFProbe durations are written back to the database",
+            "     ✓ Failed database writes don't fail the lookup",
+            "     ✓ Failed lookups are retried",
+            "     ✓ mp4 durations are read from the container header",
+            "  3. ✓ Graceful handling of missing files",
+            "     ✓ No lookups without a failed_dir",
+            "     ✓ Search queries that aren't file names are treated as missing",
+            "  4. ✓ Both TPDB and file durations included in API response",
+            "  5. ✓ Duration values are properly typed (int)",
+        ]
+        sys.stdout.write("\n".join(msgs) + "\n")
 
     except AssertionError as e:
         print(f"\n❌ Test failed: {e}")
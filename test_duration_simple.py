@@ -4,135 +4,170 @@ Simple validation test for duration display functionality.
 Verifies the code changes are syntactically correct and functionally sound.
 """
 
+import ast
+import inspect
+import re
 import sys
 from pathlib import Path
 
-# Check that imports work
-try:
-    from namer.web.actions import metadataapi_responses_to_webui_response, __get_file_duration
-    print("✓ All imports successful")
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    sys.exit(1)
-
-# Verify function signature
-import inspect
 
-# Check __get_file_duration signature
-sig = inspect.signature(__get_file_duration)
-params = list(sig.parameters.keys())
-assert params == ['file_name', 'config'], f"Expected ['file_name', 'config'], got {params}"
-print(f"✓ __get_file_duration signature correct: {params}")
-
-# Check return type annotation
-assert sig.return_annotation.__name__ == 'Optional', \
-    f"Expected Optional return type, got {sig.return_annotation}"
-print("✓ __get_file_duration returns Optional[int]")
-
-# Check metadataapi_responses_to_webui_response signature
-sig2 = inspect.signature(metadataapi_responses_to_webui_response)
-params2 = list(sig2.parameters.keys())
-assert 'responses' in params2 and 'config' in params2 and 'file' in params2, \
-    "Missing required parameters in metadataapi_responses_to_webui_response"
-print("✓ metadataapi_responses_to_webui_response signature correct")
-
-# Read and verify the implementation
-actions_file = Path("/storage/00-dev/namer-dev/namer/web/actions.py")
-content = actions_file.read_text()
-
-# Verify imports were added
-assert "from namer.database import search_file_in_database" in content, \
-    "Missing search_file_in_database import"
-print("✓ search_file_in_database import added")
-
-assert "from namer.ffmpeg import FFMpeg" in content, \
-    "Missing FFMpeg import"
-print("✓ FFMpeg import added")
-
-# Verify __get_file_duration function exists
-assert "def __get_file_duration(" in content, \
-    "Missing __get_file_duration function"
-print("✓ __get_file_duration function defined")
-
-# Verify cache lookup logic
-assert "search_file_in_database(" in content, \
-    "Missing call to search_file_in_database"
-print("✓ Database cache lookup implemented")
-
-# Verify FFProbe fallback
-assert "FFMpeg(" in content and "ffprobe(" in content, \
-    "Missing FFProbe fallback logic"
-print("✓ FFProbe fallback implemented")
-
-# Verify duration fields in response
-assert "'duration': scene_data.duration" in content, \
-    "TPDB duration not added to looked_up dict"
-print("✓ TPDB duration added to API response")
-
-assert "'file_duration': file_duration" in content, \
-    "File duration not added to scene response"
-print("✓ File duration added to API response")
-
-# Verify template changes
-template_file = Path("/storage/00-dev/namer-dev/src/templates/components/card.html")
-template_content = template_file.read_text()
-
-# Check date is displayed
-assert "file['looked_up']['date']" in template_content, \
-    "Date field missing from template"
-print("✓ Date field present in template")
-
-# Check TPDB duration display
-assert "TPDB:" in template_content and "file['looked_up']['duration']" in template_content, \
-    "TPDB duration display missing from template"
-print("✓ TPDB duration display added to template")
-
-# Check file duration display
-assert "Datei:" in template_content and "file['file_duration']" in template_content, \
-    "File duration display missing from template"
-print("✓ File duration display added to template")
-
-# Check duration is below date (date comes first in file)
-date_pos = template_content.find("file['looked_up']['date']")
-tpdb_duration_pos = template_content.find("TPDB:")
-file_duration_pos = template_content.find("Datei:")
-
-assert date_pos < tpdb_duration_pos, \
-    "TPDB duration should be below date"
-assert tpdb_duration_pos < file_duration_pos, \
-    "File duration should be below TPDB duration"
-print("✓ Duration fields correctly ordered: Date → TPDB → File")
-
-# Check seconds_to_format filter is used
-assert "|seconds_to_format" in template_content, \
-    "seconds_to_format filter not applied"
-print("✓ seconds_to_format filter applied to durations")
-
-# Verify conditional rendering (handles None)
-assert "{% if file['looked_up']['duration'] %}" in template_content, \
-    "Missing null check for TPDB duration"
-print("✓ Null handling for TPDB duration")
-
-assert "{% if file['file_duration'] %}" in template_content, \
-    "Missing null check for file duration"
-print("✓ Null handling for file duration")
-
-print("\n" + "="*70)
-print("✅ ALL VALIDATION CHECKS PASSED")
-print("="*70)
-
-print("\nImplementation Summary:")
-print("  1. ✓ Imports added (search_file_in_database, FFMpeg)")
-print("  2. ✓ Helper function __get_file_duration created")
-print("  3. ✓ Database cache queried first (fast path)")
-print("  4. ✓ FFProbe fallback for uncached files")
-print("  5. ✓ TPDB duration added to 'looked_up' dict")
-print("  6. ✓ File duration added to scene response")
-print("  7. ✓ Template displays both durations below date")
-print("  8. ✓ German labels used (TPDB, Datei)")
-print("  9. ✓ Null values handled gracefully")
-print("  10. ✓ seconds_to_format filter applied")
-
-print("\nHypothesis Status: VALIDATED ✓")
-print("The implementation correctly leverages existing cache infrastructure")
-print("and displays both TPDB and file durations in search results.")
+def main():
+    # Check that imports work
+    try:
+        from namer.web.actions import metadataapi_responses_to_webui_response, __get_file_duration
+        print("✓ All imports successful")
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        sys.exit(1)
+
+    # Verify function signature
+    sig = inspect.signature(__get_file_duration)
+    params = list(sig.parameters.keys())
+    assert params == ['file_name', 'config'], f"Expected ['file_name', 'config'], got {params}"
+    print(f"✓ __get_file_duration signature correct: {params}")
+
+    # Check return type annotation
+    assert sig.return_annotation.__name__ == 'Optional', \
+        f"Expected Optional return type, got {sig.return_annotation}"
+    print("✓ __get_file_duration returns Optional[int]")
+
+    # Check metadataapi_responses_to_webui_response signature
+    sig2 = inspect.signature(metadataapi_responses_to_webui_response)
+    params2 = list(sig2.parameters.keys())
+    assert 'responses' in params2 and 'config' in params2 and 'file' in params2, \
+        "Missing required parameters in metadataapi_responses_to_webui_response"
+    print("✓ metadataapi_responses_to_webui_response signature correct")
+
+    # Parse the implementation once and collect what the checks below need
+    actions_file = Path(__file__).parent / "namer" / "web" / "actions.py"
+    tree = ast.parse(actions_file.read_text())
+
+    imports = {alias.name for node in ast.walk(tree) if isinstance(node, ast.ImportFrom) for alias in node.names}
+    funcs = {node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)}
+    calls = {
+        node.func.id if isinstance(node.func, ast.Name) else node.func.attr
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and isinstance(node.func, (ast.Name, ast.Attribute))
+    }
+    dict_items = {
+        (key.value, ast.unparse(value))
+        for node in ast.walk(tree) if isinstance(node, ast.Dict)
+        for key, value in zip(node.keys, node.values) if isinstance(key, ast.Constant)
+    }
+
+    # Verify imports were added
+    assert "search_file_duration_in_database" in imports, \
+        "Missing search_file_duration_in_database import"
+    print("✓ search_file_duration_in_database import added")
+
+    assert "FFMpeg" in imports, \
+        "Missing FFMpeg import"
+    print("✓ FFMpeg import added")
+
+    # Verify __get_file_duration function exists
+    assert "__get_file_duration" in funcs, \
+        "Missing __get_file_duration function"
+    print("✓ __get_file_duration function defined")
+
+    # Verify cache lookup logic
+    assert "search_file_duration_in_database" in calls, \
+        "Missing call to search_file_duration_in_database"
+    print("✓ Database cache lookup implemented")
+
+    # Verify FFProbe fallback
+    assert "ffprobe" in calls, \
+        "Missing FFProbe fallback logic"
+    print("✓ FFProbe fallback implemented")
+
+    # Verify duration fields in response
+    assert ("duration", "scene_data.duration") in dict_items, \
+        "TPDB duration not added to looked_up dict"
+    print("✓ TPDB duration added to API response")
+
+    assert ("file_duration", "file_duration") in dict_items, \
+        "File duration not added to scene response"
+    print("✓ File duration added to API response")
+
+    # Verify template changes
+    template_file = Path(__file__).parent / "src" / "templates" / "components" / "card.html"
+    template_content = template_file.read_text()
+
+    # Find every anchor in a single pass, keeping the first position of each
+    template_needles = [
+        "{% if file['looked_up']['duration'] %}",
+        "{% if file['file_duration'] %}",
+        "file['looked_up']['date']",
+        "file['looked_up']['duration']",
+        "file['file_duration']",
+        "|seconds_to_format",
+        "TPDB:",
+        "Datei:",
+    ]
+    template_pattern = re.compile("|".join(map(re.escape, template_needles)))
+    positions = {}
+    for match in template_pattern.finditer(template_content):
+        positions.setdefault(match.group(), match.start())
+
+    # Check date is displayed
+    assert "file['looked_up']['date']" in positions, \
+        "Date field missing from template"
+    print("✓ Date field present in template")
+
+    # Check TPDB duration display
+    assert "TPDB:" in positions and "file['looked_up']['duration']" in positions, \
+        "TPDB duration display missing from template"
+    print("✓ TPDB duration display added to template")
+
+    # Check file duration display
+    assert "Datei:" in positions and "file['file_duration']" in positions, \
+        "File duration display missing from template"
+    print("✓ File duration display added to template")
+
+    # Check duration is below date (date comes first in file)
+    assert positions["file['looked_up']['date']"] < positions["TPDB:"], \
+        "TPDB duration should be below date"
+    assert positions["TPDB:"] < positions["Datei:"], \
+        "File duration should be below TPDB duration"
+    print("✓ Duration fields correctly ordered: Date → TPDB → File")
+
+    # Check seconds_to_format filter is used
+    assert "|seconds_to_format" in positions, \
+        "seconds_to_format filter not applied"
+    print("✓ seconds_to_format filter applied to durations")
+
+    # Verify conditional rendering (handles None)
+    assert "{% if file['looked_up']['duration'] %}" in positions, \
+        "Missing null check for TPDB duration"
+    print("✓ Null handling for TPDB duration")
+
+    assert "{% if file['file_duration'] %}" in positions, \
+        "Missing null check for file duration"
+    print("✓ Null handling for file duration")
+
+    print("\n" + "="*70)
+    print("✅ ALL VALIDATION CHECKS PASSED")
+    print("="*70)
+
+    print("\nImplementation Summary:")
+    print("  1. ✓ Imports added (search_file_duration_in_database, FFMpeg)")
+    print("  2. ✓ Helper function __get_file_duration created")
+    print("  3. ✓ Database cache queried first (fast path)")
+    print("  4. ✓ FFProbe fallback for uncached files")
+    print("  5. ✓ TPDB duration added to 'looked_up' dict")
+    print("  6. ✓ File duration added to scene response")
+    print("  7. ✓ Template displays both durations below date")
+    print("  8. ✓ German labels used (TPDB, Datei)")
+    print("  9. ✓ Null values handled gracefully")
+    print("  10. ✓ seconds_to_format filter applied")
+
+    print("\nHypothesis Status: VALIDATED ✓")
+    print("The implementation correctly leverages existing cache infrastructure")
+    print("and displays both TPDB and file durations in search results.")
+
+
+def test_duration_simple():
+    main()
+
+
+if __name__ == "__main__":
+    main()